@@ -5,22 +5,60 @@ Single file with all LLM providers
 """
 
 import os
+import re
+import ssl
+import gzip
 import json
+import queue
+import hashlib
 import asyncio
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Dict, List, Optional
 from enum import Enum
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
-import aiohttp
-from fastapi import FastAPI, HTTPException
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# uvloop (bundled with uvicorn[standard]) replaces the default event loop
+# with a libuv-based one; a large win for I/O-heavy workloads like this
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass  # not available on this platform - stock asyncio loop
+
+# Optional Redis backend so cache hits are shared across workers
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional semantic cache dependencies - the server runs fine without them
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Configure logging: handlers run off the request path via a queue so the
+# event loop never blocks on formatting or stream I/O under load
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _log_output)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -43,10 +81,66 @@ class ChatRequest(BaseModel):
     messages: List[Message]
     temperature: float = 0.7
 
-class ChatResponse(BaseModel):
-    success: bool
-    response: Optional[str] = None
-    error: Optional[str] = None
+# =============================================================================
+# SEMANTIC CACHE
+# =============================================================================
+
+class SemanticCache:
+    """Embedding-similarity cache for LLM responses.
+
+    Embeds the last user message (plus a hash of the system prompt) with a
+    local MiniLM model and searches a FAISS inner-product index over
+    L2-normalized vectors. A hit above the similarity threshold short-circuits
+    the entire provider round-trip.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1024):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.encoder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        self.dim = self.encoder.get_sentence_embedding_dimension()
+        self.indexes = {}    # cache key -> faiss.IndexIDMap over IndexFlatIP
+        self.responses = {}  # cache key -> OrderedDict[int, str] (LRU)
+        self.next_id = 0
+
+    @staticmethod
+    def cache_text(messages) -> Optional[str]:
+        system_text = "".join(m["content"] for m in messages if m["role"] == "system")
+        last_user = next((m["content"] for m in reversed(messages) if m["role"] == "user"), None)
+        if last_user is None:
+            return None
+        system_hash = hashlib.sha256(system_text.encode()).hexdigest()[:16] if system_text else ""
+        return f"{system_hash}\n{last_user}"
+
+    def _embed(self, text: str):
+        vec = self.encoder.encode([text], normalize_embeddings=True)
+        return np.asarray(vec, dtype="float32")
+
+    def get(self, key, text: str) -> Optional[str]:
+        index = self.indexes.get(key)
+        if index is None or index.ntotal == 0:
+            return None
+        scores, ids = index.search(self._embed(text), 1)
+        if ids[0][0] == -1 or scores[0][0] < self.threshold:
+            return None
+        responses = self.responses[key]
+        hit_id = int(ids[0][0])
+        responses.move_to_end(hit_id)
+        return responses[hit_id]
+
+    def put(self, key, text: str, response: str):
+        if key not in self.indexes:
+            self.indexes[key] = faiss.IndexIDMap(faiss.IndexFlatIP(self.dim))
+            self.responses[key] = OrderedDict()
+        index = self.indexes[key]
+        responses = self.responses[key]
+        entry_id = self.next_id
+        self.next_id += 1
+        index.add_with_ids(self._embed(text), np.array([entry_id], dtype="int64"))
+        responses[entry_id] = response
+        if len(responses) > self.max_entries:
+            old_id, _ = responses.popitem(last=False)
+            index.remove_ids(np.array([old_id], dtype="int64"))
 
 # =============================================================================
 # LLM CLIENTS
@@ -55,62 +149,317 @@ class ChatResponse(BaseModel):
 class LLMClients:
     def __init__(self):
         self.session = None
+        self.semantic_cache = None
+        self.redis = None
+        self.exact_cache: OrderedDict[str, str] = OrderedDict()
+        self.exact_cache_max = 10_000
+        self.exact_cache_ttl = 3600
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self._dispatch = {
+            Provider.OPENAI: self._openai_chat,
+            Provider.CLAUDE: self._claude_chat,
+            Provider.GEMINI: self._gemini_chat,
+            Provider.DEEPSEEK: self._deepseek_chat,
+        }
+        self._stream_dispatch = {
+            Provider.OPENAI: self._openai_stream,
+            Provider.CLAUDE: self._claude_stream,
+            Provider.GEMINI: self._gemini_stream,
+            Provider.DEEPSEEK: self._deepseek_stream,
+        }
+        # Per-provider concurrency ceilings so bursts queue locally instead
+        # of burning round-trips on upstream 429s
+        self.sems = {
+            Provider.OPENAI: asyncio.Semaphore(50),
+            Provider.CLAUDE: asyncio.Semaphore(30),
+            Provider.GEMINI: asyncio.Semaphore(30),
+            Provider.DEEPSEEK: asyncio.Semaphore(30),
+        }
         self.models = {
             Provider.OPENAI: ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo", "o1-preview", "o1-mini"],
             Provider.CLAUDE: ["claude-3-5-sonnet-20241022", "claude-3-5-haiku-20241022", "claude-3-opus-20240229", "claude-3-sonnet-20240229", "claude-3-haiku-20240307"],
             Provider.GEMINI: ["gemini-1.5-pro", "gemini-1.5-flash", "gemini-1.5-flash-8b", "gemini-1.0-pro", "gemini-pro", "gemini-pro-vision"],
             Provider.DEEPSEEK: ["deepseek-chat", "deepseek-reasoner", "deepseek-coder", "deepseek-v2.5"]
         }
+        self.model_sets = {p: frozenset(v) for p, v in self.models.items()}
+        self._models_json = orjson.dumps({"models": {p.value: v for p, v in self.models.items()}})
+        self._now_iso = datetime.utcnow().isoformat()
+        self._ticker_task = None
+        self._keepalive_task = None
     
     async def init(self):
-        self.session = aiohttp.ClientSession()
+        # HTTP/2 multiplexes concurrent requests to the same provider over one
+        # connection; keep-alive amortizes TLS handshakes across requests.
+        # Sharing one SSLContext keeps OpenSSL's client session cache (TLS 1.3
+        # tickets) effective across reconnects, so resumed handshakes skip a
+        # round-trip.
+        ssl_context = ssl.create_default_context()
+        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        self.session = httpx.AsyncClient(
+            http2=True,
+            verify=ssl_context,
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=128, keepalive_expiry=75),
+            timeout=httpx.Timeout(120.0, connect=5.0),
+        )
+        # Read keys and build per-provider headers/URLs once, off the hot path.
+        # Missing keys only warn so /models keeps working without credentials.
+        self._keys = {
+            Provider.OPENAI: os.getenv("OPENAI_API_KEY"),
+            Provider.CLAUDE: os.getenv("CLAUDE_API_KEY"),
+            Provider.GEMINI: os.getenv("GEMINI_API_KEY"),
+            Provider.DEEPSEEK: os.getenv("DEEPSEEK_API_KEY"),
+        }
+        for provider, key in self._keys.items():
+            if not key:
+                logger.warning("%s API key not configured", provider.value)
+        self._urls = {
+            Provider.OPENAI: "https://api.openai.com/v1/chat/completions",
+            Provider.CLAUDE: "https://api.anthropic.com/v1/messages",
+            Provider.DEEPSEEK: "https://api.deepseek.com/v1/chat/completions",
+        }
+        self._headers = {
+            Provider.OPENAI: {"Authorization": f"Bearer {self._keys[Provider.OPENAI]}", "Content-Type": "application/json"},
+            Provider.CLAUDE: {"x-api-key": self._keys[Provider.CLAUDE], "Content-Type": "application/json", "anthropic-version": "2023-06-01"},
+            Provider.GEMINI: {"Content-Type": "application/json"},
+            Provider.DEEPSEEK: {"Authorization": f"Bearer {self._keys[Provider.DEEPSEEK]}", "Content-Type": "application/json"},
+        }
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and REDIS_AVAILABLE:
+            self.redis = aioredis.from_url(redis_url)
+            logger.info("Redis response cache enabled")
+        elif redis_url:
+            logger.warning("REDIS_URL set but redis package not installed - using in-process cache")
+        asyncio.ensure_future(self._prewarm())
+        self._keepalive_task = asyncio.create_task(self._keepalive())
+        # /health is polled constantly; a once-per-second ticker is plenty
+        self._ticker_task = asyncio.create_task(self._ticker())
+        if SEMANTIC_CACHE_AVAILABLE:
+            self.semantic_cache = SemanticCache()
+            logger.info("Semantic cache initialized")
+        else:
+            self.semantic_cache = None
+            logger.info("Semantic cache dependencies not installed - caching disabled")
         logger.info("LLM clients initialized")
     
+    async def _ticker(self):
+        while True:
+            self._now_iso = datetime.utcnow().isoformat()
+            await asyncio.sleep(1)
+
+    PROVIDER_DOMAINS = [
+        "https://api.openai.com",
+        "https://api.anthropic.com",
+        "https://generativelanguage.googleapis.com",
+        "https://api.deepseek.com",
+    ]
+
+    async def _prewarm(self):
+        """Open connections to each provider up front so the first real
+        request doesn't pay for DNS + TCP + TLS setup."""
+        for domain in self.PROVIDER_DOMAINS:
+            try:
+                await self.session.head(domain, timeout=5.0)
+            except Exception:
+                pass  # Best effort - the pool just stays cold for this host
+
+    async def _keepalive(self):
+        """Ping each provider every 30s so pooled connections aren't
+        idle-evicted and bursty traffic never pays DNS + TLS setup."""
+        while True:
+            await asyncio.sleep(30)
+            for domain in self.PROVIDER_DOMAINS:
+                try:
+                    await self.session.head(domain, timeout=5.0)
+                except Exception:
+                    pass
+
     async def cleanup(self):
+        if self._ticker_task:
+            self._ticker_task.cancel()
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+        if self.redis is not None:
+            await self.redis.aclose()
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
             logger.info("LLM clients cleaned up")
     
-    async def chat(self, provider: Provider, model: str, messages: List[Message], temperature: float) -> str:
-        if provider == Provider.OPENAI:
-            return await self._openai_chat(model, messages, temperature)
-        elif provider == Provider.CLAUDE:
-            return await self._claude_chat(model, messages, temperature)
-        elif provider == Provider.GEMINI:
-            return await self._gemini_chat(model, messages, temperature)
-        elif provider == Provider.DEEPSEEK:
-            return await self._deepseek_chat(model, messages, temperature)
+    _MEMORY_RE = re.compile(r"<MEMORIES>.*?</MEMORIES>", re.DOTALL)
+
+    @classmethod
+    def _split_memory_block(cls, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Keep the system prompt byte-stable across calls so provider
+        prompt-prefix caches stay warm.
+
+        Dynamic <MEMORIES>...</MEMORIES> content injected into the system
+        prompt is pulled out and re-emitted as a user message just before the
+        latest user turn, leaving a stable static prefix as the system text.
+        """
+        if not messages or messages[0]["role"] != "system":
+            return messages
+        match = cls._MEMORY_RE.search(messages[0]["content"])
+        if not match:
+            return messages
+        content = messages[0]["content"]
+        static_prefix = (content[:match.start()] + content[match.end():]).strip()
+        out = [{"role": "system", "content": static_prefix}] + messages[1:]
+        insert_at = len(out)
+        for i in range(len(out) - 1, 0, -1):
+            if out[i]["role"] == "user":
+                insert_at = i
+                break
+        out.insert(insert_at, {"role": "user", "content": match.group(0)})
+        return out
+
+    @staticmethod
+    def _exact_key(provider: Provider, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        canonical = json.dumps(
+            {"p": provider, "m": model, "t": temperature, "msgs": [(m["role"], m["content"]) for m in messages]},
+            sort_keys=True,
+        )
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    async def _exact_cache_get(self, key: str) -> Optional[str]:
+        if self.redis is not None:
+            try:
+                value = await self.redis.get(key)
+                return value.decode() if value is not None else None
+            except Exception as e:
+                logger.warning("Redis get failed: %s", e)
+                return None
+        if key in self.exact_cache:
+            self.exact_cache.move_to_end(key)
+            return self.exact_cache[key]
+        return None
+
+    async def _exact_cache_put(self, key: str, response: str):
+        if self.redis is not None:
+            try:
+                await self.redis.setex(key, self.exact_cache_ttl, response)
+            except Exception as e:
+                logger.warning("Redis set failed: %s", e)
+            return
+        self.exact_cache[key] = response
+        if len(self.exact_cache) > self.exact_cache_max:
+            self.exact_cache.popitem(last=False)
+
+    async def chat(self, provider: Provider, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        messages = self._split_memory_block(messages)
+
+        # Cheapest first: byte-identical payloads are served straight from a dict
+        exact_key = self._exact_key(provider, model, messages, temperature)
+        cached = await self._exact_cache_get(exact_key)
+        if cached is not None:
+            logger.info("Exact cache hit")
+            return cached
+
+        # Single-flight: identical in-flight requests share one provider call
+        inflight = self.inflight.get(exact_key)
+        if inflight is not None:
+            logger.info("Joining in-flight request")
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[exact_key] = future
+        try:
+            response = await self._chat_uncached(provider, model, messages, temperature, exact_key)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved so lone failures don't warn
+            raise
         else:
+            future.set_result(response)
+            return response
+        finally:
+            del self.inflight[exact_key]
+
+    async def _chat_uncached(self, provider: Provider, model: str, messages: List[Dict[str, str]], temperature: float, exact_key: str) -> str:
+        # Only near-deterministic requests are safe to serve from cache
+        cacheable = self.semantic_cache is not None and temperature < 0.3
+        if cacheable:
+            cache_key = (provider, model, round(temperature, 2))
+            cache_text = SemanticCache.cache_text(messages)
+            if cache_text is not None:
+                cached = self.semantic_cache.get(cache_key, cache_text)
+                if cached is not None:
+                    logger.info("Semantic cache hit")
+                    return cached
+            cacheable = cache_text is not None
+
+        response = await self._provider_chat(provider, model, messages, temperature)
+
+        if cacheable:
+            self.semantic_cache.put(cache_key, cache_text, response)
+        await self._exact_cache_put(exact_key, response)
+        return response
+
+    _KEY_ERRORS = {
+        Provider.OPENAI: "OpenAI API key not configured",
+        Provider.CLAUDE: "Claude API key not configured",
+        Provider.GEMINI: "Gemini API key not configured",
+        Provider.DEEPSEEK: "DeepSeek API key not configured",
+    }
+
+    def _require_key(self, provider: Provider) -> str:
+        key = self._keys[provider]
+        if not key:
+            raise ValueError(self._KEY_ERRORS[provider])
+        return key
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    GZIP_THRESHOLD = 4096
+
+    @staticmethod
+    def _encode_body(payload: dict, headers: Optional[dict]):
+        """Encode a payload, gzipping large bodies (level 1 is ~5x faster
+        than the default with little ratio loss). All four providers accept
+        Content-Encoding: gzip."""
+        body = orjson.dumps(payload, default=str)
+        if len(body) > LLMClients.GZIP_THRESHOLD:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        return body, headers
+
+    async def _post(self, provider: Provider, url: str, payload: dict, headers: Optional[dict] = None) -> httpx.Response:
+        """POST under the provider's semaphore, retrying transient failures
+        with exponential backoff (up to 5 attempts)."""
+        body, headers = self._encode_body(payload, headers)
+        async with self.sems[provider]:
+            for attempt in range(5):
+                resp = await self.session.post(url, headers=headers, content=body)
+                if resp.status_code in self.RETRY_STATUSES and attempt < 4:
+                    delay = min(2 ** attempt, 30)
+                    logger.warning("%s returned %s, retrying in %ss", provider, resp.status_code, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                return resp
+        return resp
+
+    async def _provider_chat(self, provider: Provider, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        handler = self._dispatch.get(provider)
+        if not handler:
             raise ValueError(f"Unsupported provider: {provider}")
+        return await handler(model, messages, temperature)
     
-    async def _openai_chat(self, model: str, messages: List[Message], temperature: float) -> str:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OpenAI API key not configured")
-        
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    async def _openai_chat(self, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        self._require_key(Provider.OPENAI)
         payload = {
             "model": model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "messages": messages,
             "temperature": temperature,
             "max_tokens": 2048
         }
         
-        async with self.session.post("https://api.openai.com/v1/chat/completions", 
-                                   headers=headers, json=payload) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise Exception(f"OpenAI API error: {resp.status} - {error_text}")
-            data = await resp.json()
-            return data["choices"][0]["message"]["content"]
+        resp = await self._post(Provider.OPENAI, self._urls[Provider.OPENAI],
+                                payload, headers=self._headers[Provider.OPENAI])
+        if resp.status_code != 200:
+            raise Exception(f"OpenAI API error: {resp.status_code} - {resp.text}")
+        data = orjson.loads(resp.content)
+        return data["choices"][0]["message"]["content"]
     
-    async def _claude_chat(self, model: str, messages: List[Message], temperature: float) -> str:
-        api_key = os.getenv("CLAUDE_API_KEY")
-        if not api_key:
-            raise ValueError("Claude API key not configured")
-        
-        headers = {"x-api-key": api_key, "Content-Type": "application/json", "anthropic-version": "2023-06-01"}
-        claude_messages = [{"role": m.role, "content": m.content} for m in messages if m.role != "system"]
+    async def _claude_chat(self, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        self._require_key(Provider.CLAUDE)
+        claude_messages = [m for m in messages if m["role"] != "system"]
         
         payload = {
             "model": model,
@@ -118,24 +467,24 @@ class LLMClients:
             "max_tokens": 2048,
             "temperature": temperature
         }
+        system_text = "".join(m["content"] for m in messages if m["role"] == "system")
+        if system_text:
+            # Mark the stable system prefix for Anthropic's prompt cache
+            payload["system"] = [{"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}]
         
-        async with self.session.post("https://api.anthropic.com/v1/messages", 
-                                   headers=headers, json=payload) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise Exception(f"Claude API error: {resp.status} - {error_text}")
-            data = await resp.json()
-            return data["content"][0]["text"]
+        resp = await self._post(Provider.CLAUDE, self._urls[Provider.CLAUDE],
+                                payload, headers=self._headers[Provider.CLAUDE])
+        if resp.status_code != 200:
+            raise Exception(f"Claude API error: {resp.status_code} - {resp.text}")
+        data = orjson.loads(resp.content)
+        return data["content"][0]["text"]
     
-    async def _gemini_chat(self, model: str, messages: List[Message], temperature: float) -> str:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("Gemini API key not configured")
-        
+    async def _gemini_chat(self, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        api_key = self._require_key(Provider.GEMINI)
         contents = []
         for m in messages:
-            role = "user" if m.role in ["user", "system"] else "model"
-            contents.append({"role": role, "parts": [{"text": m.content}]})
+            role = "user" if m["role"] in ["user", "system"] else "model"
+            contents.append({"role": role, "parts": [{"text": m["content"]}]})
         
         payload = {
             "contents": contents,
@@ -143,33 +492,113 @@ class LLMClients:
         }
         
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-        async with self.session.post(url, json=payload) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise Exception(f"Gemini API error: {resp.status} - {error_text}")
-            data = await resp.json()
-            return data["candidates"][0]["content"]["parts"][0]["text"]
+        resp = await self._post(Provider.GEMINI, url, payload,
+                                headers=self._headers[Provider.GEMINI])
+        if resp.status_code != 200:
+            raise Exception(f"Gemini API error: {resp.status_code} - {resp.text}")
+        data = orjson.loads(resp.content)
+        return data["candidates"][0]["content"]["parts"][0]["text"]
     
-    async def _deepseek_chat(self, model: str, messages: List[Message], temperature: float) -> str:
-        api_key = os.getenv("DEEPSEEK_API_KEY")
-        if not api_key:
-            raise ValueError("DeepSeek API key not configured")
-        
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    async def _deepseek_chat(self, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        self._require_key(Provider.DEEPSEEK)
         payload = {
             "model": model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "messages": messages,
             "temperature": temperature,
             "max_tokens": 2048
         }
         
-        async with self.session.post("https://api.deepseek.com/v1/chat/completions", 
-                                   headers=headers, json=payload) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise Exception(f"DeepSeek API error: {resp.status} - {error_text}")
-            data = await resp.json()
-            return data["choices"][0]["message"]["content"]
+        resp = await self._post(Provider.DEEPSEEK, self._urls[Provider.DEEPSEEK],
+                                payload, headers=self._headers[Provider.DEEPSEEK])
+        if resp.status_code != 200:
+            raise Exception(f"DeepSeek API error: {resp.status_code} - {resp.text}")
+        data = orjson.loads(resp.content)
+        return data["choices"][0]["message"]["content"]
+
+    def chat_stream(self, provider: Provider, model: str, messages: List[Dict[str, str]], temperature: float):
+        """Return an async generator yielding response text deltas as they
+        arrive from the provider, cutting TTFB to first-token latency."""
+        handler = self._stream_dispatch.get(provider)
+        if not handler:
+            raise ValueError(f"Unsupported provider: {provider}")
+        return handler(model, self._split_memory_block(messages), temperature)
+
+    async def _sse_stream(self, provider: Provider, url: str, payload: dict, headers: Optional[dict], name: str):
+        """Yield raw SSE data frames from a streaming POST."""
+        body, headers = self._encode_body(payload, headers)
+        async with self.sems[provider]:
+            async with self.session.stream("POST", url, headers=headers, content=body) as resp:
+                if resp.status_code != 200:
+                    error_text = (await resp.aread()).decode()
+                    raise Exception(f"{name} API error: {resp.status_code} - {error_text}")
+                async for line in resp.aiter_lines():
+                    if line.startswith("data: "):
+                        yield line[6:]
+
+    async def _openai_stream(self, model: str, messages: List[Dict[str, str]], temperature: float):
+        self._require_key(Provider.OPENAI)
+        payload = {"model": model, "messages": messages, "temperature": temperature,
+                   "max_tokens": 2048, "stream": True}
+
+        async for frame in self._sse_stream(Provider.OPENAI, self._urls[Provider.OPENAI],
+                                            payload, self._headers[Provider.OPENAI], "OpenAI"):
+            if frame == "[DONE]":
+                break
+            text = orjson.loads(frame)["choices"][0].get("delta", {}).get("content")
+            if text:
+                yield text
+
+    async def _claude_stream(self, model: str, messages: List[Dict[str, str]], temperature: float):
+        self._require_key(Provider.CLAUDE)
+        claude_messages = [m for m in messages if m["role"] != "system"]
+        payload = {"model": model, "messages": claude_messages, "max_tokens": 2048,
+                   "temperature": temperature, "stream": True}
+        system_text = "".join(m["content"] for m in messages if m["role"] == "system")
+        if system_text:
+            payload["system"] = [{"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}]
+
+        async for frame in self._sse_stream(Provider.CLAUDE, self._urls[Provider.CLAUDE],
+                                            payload, self._headers[Provider.CLAUDE], "Claude"):
+            event = orjson.loads(frame)
+            if event.get("type") == "content_block_delta":
+                text = event["delta"].get("text")
+                if text:
+                    yield text
+
+    async def _gemini_stream(self, model: str, messages: List[Dict[str, str]], temperature: float):
+        api_key = self._require_key(Provider.GEMINI)
+        contents = []
+        for m in messages:
+            role = "user" if m["role"] in ["user", "system"] else "model"
+            contents.append({"role": role, "parts": [{"text": m["content"]}]})
+
+        payload = {
+            "contents": contents,
+            "generationConfig": {"temperature": temperature, "maxOutputTokens": 2048}
+        }
+
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={api_key}"
+        async for frame in self._sse_stream(Provider.GEMINI, url, payload,
+                                            self._headers[Provider.GEMINI], "Gemini"):
+            chunk = orjson.loads(frame)
+            for candidate in chunk.get("candidates", []):
+                for part in candidate.get("content", {}).get("parts", []):
+                    text = part.get("text")
+                    if text:
+                        yield text
+
+    async def _deepseek_stream(self, model: str, messages: List[Dict[str, str]], temperature: float):
+        self._require_key(Provider.DEEPSEEK)
+        payload = {"model": model, "messages": messages, "temperature": temperature,
+                   "max_tokens": 2048, "stream": True}
+
+        async for frame in self._sse_stream(Provider.DEEPSEEK, self._urls[Provider.DEEPSEEK],
+                                            payload, self._headers[Provider.DEEPSEEK], "DeepSeek"):
+            if frame == "[DONE]":
+                break
+            text = orjson.loads(frame)["choices"][0].get("delta", {}).get("content")
+            if text:
+                yield text
 
 # =============================================================================
 # FASTAPI APPLICATION
@@ -187,7 +616,8 @@ app = FastAPI(
     title="Unified AI Client API",
     description="Multi-LLM API with OpenAI, Claude, Gemini, and DeepSeek",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -200,22 +630,51 @@ app.add_middleware(
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "timestamp": datetime.utcnow(), "version": "1.0.0"}
+    return {"status": "healthy", "timestamp": clients._now_iso, "version": "1.0.0"}
 
 @app.get("/models")
 async def get_models():
-    return {"models": clients.models}
+    return Response(content=clients._models_json, media_type="application/json")
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+@app.post("/chat")
+async def chat(request: Request):
+    # Validate by hand instead of through ChatRequest: skipping per-message
+    # Pydantic model construction is a real saving on long histories
     try:
-        logger.info(f"Chat request: {request.provider} - {request.model}")
-        response = await clients.chat(request.provider, request.model, request.messages, request.temperature)
+        req = orjson.loads(await request.body())
+        provider = Provider(req["provider"])
+        model = req["model"]
+        messages = req["messages"]
+        temperature = float(req.get("temperature", 0.7))
+        if not isinstance(messages, list) or not all(
+            isinstance(m, dict) and "role" in m and "content" in m for m in messages
+        ):
+            raise ValueError("messages must be a list of {role, content} objects")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request: {e}")
+
+    # Reject unknown models up front instead of after a provider round-trip
+    if model not in clients.model_sets[provider]:
+        raise HTTPException(status_code=400, detail=f"Unknown model for {provider.value}: {model}")
+    try:
+        logger.info("Chat request: %s - %s", provider, model)
+        response = await clients.chat(provider, model, messages, temperature)
         logger.info("Chat response generated successfully")
-        return ChatResponse(success=True, response=response)
+        return ORJSONResponse({"success": True, "response": response})
     except Exception as e:
-        logger.error(f"Chat request failed: {e}")
-        return ChatResponse(success=False, error=str(e))
+        logger.error("Chat request failed: %s", e)
+        return ORJSONResponse({"success": False, "error": str(e)})
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    if request.model not in clients.model_sets[request.provider]:
+        raise HTTPException(status_code=400, detail=f"Unknown model for {request.provider.value}: {request.model}")
+    logger.info("Streaming chat request: %s - %s", request.provider, request.model)
+    messages = [m.__dict__ for m in request.messages]
+    generator = clients.chat_stream(request.provider, request.model, messages, request.temperature)
+    return StreamingResponse(generator, media_type="text/event-stream")
 
 @app.get("/")
 async def root():
@@ -225,4 +684,5 @@ if __name__ == "__main__":
     print("🚀 Starting Unified AI Backend")
     print("📊 API Documentation: http://localhost:8000/docs")
     print("❤️ Health Check: http://localhost:8000/health")
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, log_level="info",
+                http="httptools", workers=max(2, os.cpu_count()))